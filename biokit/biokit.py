@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
-import logging
+import functools
+import re
 import sys
 import textwrap
 from .version import __version__
@@ -11,68 +12,6 @@ from argparse import (
     RawDescriptionHelpFormatter,
 )
 
-from .services.alignment import (
-    AlignmentLength,
-    AlignmentRecoding,
-    AlignmentSummary,
-    ConsensusSequence,
-    ConstantSites,
-    ParsimonyInformativeSites,
-    PositionSpecificScoreMatrix,
-    VariableSites,
-)
-
-from .services.coding_sequences import (
-    GCContentFirstPosition,
-    GCContentSecondPosition,
-    GCContentThirdPosition,
-    GeneWiseRelativeSynonymousCodonUsage,
-    RelativeSynonymousCodonUsage,
-    TranslateSequence,
-)
-
-from .services.fastq import (
-    FastQReadLengths,
-    SubsetPEFastQReads,
-    SubsetSEFastQReads,
-    TrimPEAdaptersFastQ,
-    TrimPEFastQ,
-    TrimSEAdaptersFastQ,
-    TrimSEFastQ,
-)
-
-from .services.genome import (
-    GCContent,
-    GenomeAssemblyMetrics,
-    L50,
-    L90,
-    LongestScaffold,
-    N50,
-    N90,
-    NumberOfLargeScaffolds,
-    NumberOfScaffolds,
-    SumOfScaffoldLengths,
-)
-
-from .services.text import (
-    CharacterFrequency,
-    Faidx,
-    FileFormatConverter,
-    MultipleLineToSingleLineFasta,
-    RemoveFastaEntry,
-    RemoveShortSequences,
-    RenameFastaEntries,
-    ReorderBySequenceLength,
-    SequenceComplement,
-    SequenceLength,
-    SingleLineToMultipleLineFasta,
-)
-
-logger = logging.getLogger(__name__)
-ch = logging.StreamHandler()
-ch.setLevel(logging.INFO)
-logger.addHandler(ch)
-
 help_header = fr"""
                  ____  _       _  _______ _______
                 |  _ \(_)     | |/ /_   _|__   __|
@@ -87,6 +26,7 @@ help_header = fr"""
                 
 """  # noqa
 
+
 translation_table_codes = f"""
                 Codes for which translation table to use
                 =====================================================
@@ -136,29 +76,7 @@ adapters_available = f"""
 """  # noqa
 
 
-class Biokit(object):
-    help_header = fr"""
-                 ____  _       _  _______ _______ 
-                |  _ \(_)     | |/ /_   _|__   __|
-                | |_) |_  ___ | ' /  | |    | |   
-                |  _ <| |/ _ \|  <   | |    | |   
-                | |_) | | (_) | . \ _| |_   | |   
-                |____/|_|\___/|_|\_\_____|  |_|   
-                            
-                Version: {__version__}
-                Citation: Steenwyk et al. 2021, bioRxiv. DOI: 10.1101/2021.10.02.462868
-                https://www.biorxiv.org/content/10.1101/2021.10.02.462868v1
-
-    """  # noqa
-
-    def __init__(self):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {self.help_header}
+_BIOKIT_DESC = """\
 
                 BioKIT is a broadly applicable command-line toolkit for bioinformatics research.
 
@@ -323,138 +241,8 @@ class Biokit(object):
                     - reformats sequences so that there are 60
                       characters per sequence line
                 """  # noqa
-            ),
-        )
-        parser.add_argument("command", help=SUPPRESS)
-        args = parser.parse_args(sys.argv[1:2])
-
-        # if command is part of the possible commands (i.e., the long form
-        # commands, run). Otherwise, assume it is an alias and look to the
-        # run_alias function
-        try:
-            if hasattr(self, args.command):
-                getattr(self, args.command)(sys.argv[2:])
-            else:
-                self.run_alias(args.command, sys.argv[2:], parser)
-        except NameError as e:
-            print(e)
-            sys.exit()
-
-    # aliases # noqa
-    def run_alias(self, command, argv, parser):
-        # version
-        if command in ["v"]:
-            return self.version()
-        # aliases for alignments
-        elif command in ["aln_len"]:
-            return self.alignment_length(argv)
-        elif command in ["aln_recoding", "recode"]:
-            return self.alignment_recoding(argv)
-        elif command in ["aln_summary"]:
-            return self.alignment_summary(argv)
-        elif command in ["con_seq"]:
-            return self.consensus_sequence(argv)
-        elif command in ["con_sites"]:
-            return self.constant_sites(argv)
-        elif command in ["parsimony_informative_sites", "pi_sites", "pis"]:
-            return self.parsimony_informative_sites(argv)
-        elif command in ["pssm"]:
-            return self.position_specific_score_matrix(argv)
-        elif command in ["var_sites", "vs"]:
-            return self.variable_sites(argv)
-        # aliases for coding sequences
-        elif command in ["gc1"]:
-            return self.gc_content_first_position(argv)
-        elif command in ["gc2"]:
-            return self.gc_content_second_position(argv)
-        elif command in ["gc3"]:
-            return self.gc_content_third_position(argv)
-        elif command in ["gene_wise_rscu", "gw_rscu", "grscu"]:
-            return self.gene_wise_relative_synonymous_codon_usage(argv)
-        elif command in ["rscu"]:
-            return self.relative_synonymous_codon_usage(argv)
-        elif command in ["translate_seq", "trans_seq"]:
-            return self.translate_sequence(argv)
-        # aliases for fastq files
-        elif command in ["fastq_read_lens"]:
-            return self.fastq_read_lengths(argv)
-        elif command in ["subset_pe_fastq"]:
-            return self.subset_pe_fastq_reads(argv)
-        elif command in ["subset_se_fastq"]:
-            return self.subset_se_fastq_reads(argv)
-        elif command in ["trim_pe_adapters_fastq_reads"]:
-            return self.trim_pe_adapters_fastq(argv)
-        elif command in ["trim_pe_fastq_reads"]:
-            return self.trim_pe_fastq(argv)
-        elif command in ["trim_se_adapters_fastq_reads"]:
-            return self.trim_se_adapters_fastq(argv)
-        elif command in ["trim_se_fastq_reads"]:
-            return self.trim_se_fastq(argv)
-        # aliases for genomes
-        elif command in ["gc"]:
-            return self.gc_content(argv)
-        elif command in ["assembly_metrics"]:
-            return self.genome_assembly_metrics(argv)
-        elif command in ["longest_scaff", "longest_contig", "longest_cont"]:
-            return self.longest_scaffold(argv)
-        elif command in [
-            "num_of_lrg_scaffolds",
-            "number_of_large_contigs",
-            "num_of_lrg_cont",
-        ]:
-            return self.number_of_large_scaffolds(argv)
-        elif command in ["num_of_scaffolds", "number_of_contigs", "num_of_cont"]:
-            return self.number_of_scaffolds(argv)
-        elif command in ["sum_of_contig_lengths"]:
-            return self.sum_of_scaffold_lengths(argv)
-        # alias for sequence files
-        elif command in ["char_freq"]:
-            return self.character_frequency(argv)
-        elif command in ["get_entry", "ge"]:
-            return self.faidx(argv)
-        elif command in ["format_converter", "ffc"]:
-            return self.file_format_converter(argv)
-        elif command in ["ml2sl"]:
-            return self.multiple_line_to_single_line_fasta(argv)
-        elif command in ["remove_short_seqs"]:
-            return self.remove_short_sequences(argv)
-        elif command in ["rename_fasta"]:
-            return self.rename_fasta_entries(argv)
-        elif command in ["reorder_by_seq_len"]:
-            return self.reorder_by_sequence_length(argv)
-        elif command in ["seq_comp"]:
-            return self.sequence_complement(argv)
-        elif command in ["seq_len"]:
-            return self.sequence_length(argv)
-        elif command in ["sl2ml"]:
-            return self.single_line_to_multiple_line_fasta(argv)
-        else:
-            print(
-                "Invalid command option. See help for a complete list of commands and aliases."
-            )
-            parser.print_help()
-            sys.exit(1)
-
-    # print version
-    def version(self):
-        print(
-            textwrap.dedent(
-                f"""\
-            {self.help_header}
-            """
-            )
-        )
 
-    # alignment functions
-    @staticmethod
-    def alignment_length(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_ALIGNMENT_LENGTH_DESC = """\
 
                 Calculate the length of an alignment. 
                 
@@ -472,22 +260,8 @@ class Biokit(object):
                                             function name should be
                                             a fasta file
                 """  # noqa
-            ),
-        )
-
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        AlignmentLength(args).run()
 
-    @staticmethod
-    def alignment_recoding(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_ALIGNMENT_RECODING_DESC = """\
 
                 Recode alignments using reduced character states.
 
@@ -545,23 +319,8 @@ class Biokit(object):
                     4 = F and Y
                     5 = C and V
                 """  # noqa
-            ),
-        )
-
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        parser.add_argument("-c", "--code", type=str, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        AlignmentRecoding(args).run()
 
-    @staticmethod
-    def alignment_summary(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_ALIGNMENT_SUMMARY_DESC = """\
 
                 Summary statistics for an alignment. Reported
                 statistics include alignment length, number of taxa,
@@ -583,22 +342,8 @@ class Biokit(object):
                                             function name should be
                                             a fasta file
                 """  # noqa
-            ),
-        )
-
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        AlignmentSummary(args).run()
 
-    @staticmethod
-    def consensus_sequence(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_CONSENSUS_SEQUENCE_DESC = """\
 
                 Generates a consequence from a multiple sequence alignment
                 file in FASTA format.
@@ -625,24 +370,8 @@ class Biokit(object):
                 -ac/--ambiguous_character   the ambiguity character to
                                             use. Default is 'N'
                 """  # noqa
-            ),
-        )
-
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        parser.add_argument("-t", "--threshold", type=str, help=SUPPRESS)
-        parser.add_argument("-ac", "--ambiguous_character", type=str, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        ConsensusSequence(args).run()
 
-    @staticmethod
-    def constant_sites(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_CONSTANT_SITES_DESC = """\
 
                 Calculate the number of constant sites in an
                 alignment.
@@ -668,23 +397,8 @@ class Biokit(object):
                  -v/--verbose               optional argument to print
                                             site-by-site categorization
                 """  # noqa
-            ),
-        )
-
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        parser.add_argument("-v", "--verbose", action="store_true", required=False, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        ConstantSites(args).run()
 
-    @staticmethod
-    def parsimony_informative_sites(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_PARSIMONY_INFORMATIVE_SITES_DESC = """\
 
                 Calculate the number of parsimony informative
                 sites in an alignment.
@@ -713,23 +427,8 @@ class Biokit(object):
                  -v/--verbose               optional argument to print
                                             site-by-site categorization
                 """  # noqa
-            ),
-        )
-
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        parser.add_argument("-v", "--verbose", action="store_true", required=False, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        ParsimonyInformativeSites(args).run()
 
-    @staticmethod
-    def position_specific_score_matrix(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_POSITION_SPECIFIC_SCORE_MATRIX_DESC = """\
 
                 Generates a position specific score matrix for an alignment.
                 
@@ -751,23 +450,8 @@ class Biokit(object):
                 -ac/--ambiguous_character   the ambiguity character to
                                             use. Default is 'N'
                 """  # noqa
-            ),
-        )
-
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        parser.add_argument("-ac", "--ambiguous_character", type=str, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        PositionSpecificScoreMatrix(args).run()
 
-    @staticmethod
-    def variable_sites(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_VARIABLE_SITES_DESC = """\
 
                 Calculate the number of variable sites in an
                 alignment.
@@ -793,24 +477,8 @@ class Biokit(object):
                  -v/--verbose               optional argument to print
                                             site-by-site categorization
                 """  # noqa
-            ),
-        )
-
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        parser.add_argument("-v", "--verbose", action="store_true", required=False, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        VariableSites(args).run()
 
-    # coding sequence functions
-    @staticmethod
-    def gc_content_first_position(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_GC_CONTENT_FIRST_POSITION_DESC = """\
                 
                 Calculate GC content of the first codon position.
                 The input must be the coding sequence of a gene or
@@ -835,24 +503,8 @@ class Biokit(object):
                                             the GC content of each fasta
                                             entry
                 """  # noqa
-            ),
-        )
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        parser.add_argument(
-            "-v", "--verbose", action="store_true", required=False, help=SUPPRESS
-        )
-        args = parser.parse_args(argv)
-        GCContentFirstPosition(args).run()
 
-    @staticmethod
-    def gc_content_second_position(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_GC_CONTENT_SECOND_POSITION_DESC = """\
                 
                 Calculate GC content of the second codon position.
                 The input must be the coding sequence of a gene or
@@ -877,24 +529,8 @@ class Biokit(object):
                                             the GC content of each fasta
                                             entry
                 """  # noqa
-            ),
-        )
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        parser.add_argument(
-            "-v", "--verbose", action="store_true", required=False, help=SUPPRESS
-        )
-        args = parser.parse_args(argv)
-        GCContentSecondPosition(args).run()
 
-    @staticmethod
-    def gc_content_third_position(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_GC_CONTENT_THIRD_POSITION_DESC = """\
                 
                 Calculate GC content of the third codon position.
                 The input must be the coding sequence of a gene or
@@ -919,24 +555,8 @@ class Biokit(object):
                                             the GC content of each fasta
                                             entry
                 """  # noqa
-            ),
-        )
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        parser.add_argument(
-            "-v", "--verbose", action="store_true", required=False, help=SUPPRESS
-        )
-        args = parser.parse_args(argv)
-        GCContentThirdPosition(args).run()
 
-    @staticmethod
-    def gene_wise_relative_synonymous_codon_usage(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_GENE_WISE_RELATIVE_SYNONYMOUS_CODON_USAGE_DESC = f"""\
 
                 Calculate gene-wise relative synonymous codon usage (gw-RSCU).
 
@@ -980,24 +600,8 @@ class Biokit(object):
 
                 {translation_table_codes}
                 """  # noqa
-            ),
-        )
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        parser.add_argument(
-            "-tt", "--translation_table", type=str, required=False, help=SUPPRESS
-        )
-        args = parser.parse_args(argv)
-        GeneWiseRelativeSynonymousCodonUsage(args).run()
 
-    @staticmethod
-    def relative_synonymous_codon_usage(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_RELATIVE_SYNONYMOUS_CODON_USAGE_DESC = f"""\
 
                 Calculate relative synonymous codon usage.
 
@@ -1031,24 +635,8 @@ class Biokit(object):
 
                 {translation_table_codes}
                 """  # noqa
-            ),
-        )
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        parser.add_argument(
-            "-tt", "--translation_table", type=str, required=False, help=SUPPRESS
-        )
-        args = parser.parse_args(argv)
-        RelativeSynonymousCodonUsage(args).run()
 
-    @staticmethod
-    def translate_sequence(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_TRANSLATE_SEQUENCE_DESC = f"""\
 
                 Translates coding sequences to amino acid
                 sequences. Sequences can be translated using
@@ -1091,27 +679,8 @@ class Biokit(object):
 
                 {translation_table_codes}
                 """  # noqa
-            ),
-        )
-
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        parser.add_argument(
-            "-tt", "--translation_table", type=str, required=False, help=SUPPRESS
-        )
-        parser.add_argument("-o", "--output", type=str, required=False, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        TranslateSequence(args).run()
 
-    # fastq file functions
-    @staticmethod
-    def fastq_read_lengths(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_FASTQ_READ_LENGTHS_DESC = """\
 
                 Determine lengths of fastq reads.
                 
@@ -1138,25 +707,8 @@ class Biokit(object):
                 -v/--verbose                print length of each fastq
                                             read
                 """  # noqa
-            ),
-        )
-
-        parser.add_argument("fastq", type=str, help=SUPPRESS)
-        parser.add_argument(
-            "-v", "--verbose", action="store_true", required=False, help=SUPPRESS
-        )
-        args = parser.parse_args(argv)
-        FastQReadLengths(args).run()
 
-    @staticmethod
-    def subset_pe_fastq_reads(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_SUBSET_PE_FASTQ_READS_DESC = """\
 
                 Subset paired-end FASTQ data.
 
@@ -1198,25 +750,8 @@ class Biokit(object):
                 -s/--seed                   seed for random sampling.
                                             Default: date and time
                 """  # noqa
-            ),
-        )
 
-        parser.add_argument("fastq1", type=str, help=SUPPRESS)
-        parser.add_argument("fastq2", type=str, help=SUPPRESS)
-        parser.add_argument("-p", "--percent", type=str, required=False, help=SUPPRESS)
-        parser.add_argument("-s", "--seed", type=str, required=False, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        SubsetPEFastQReads(args).run()
-
-    @staticmethod
-    def subset_se_fastq_reads(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_SUBSET_SE_FASTQ_READS_DESC = """\
 
                 Subset single-end FASTQ data.
 
@@ -1245,27 +780,8 @@ class Biokit(object):
 
                 -o/--output_file            output file name
                 """  # noqa
-            ),
-        )
-
-        parser.add_argument("fastq", type=str, help=SUPPRESS)
-        parser.add_argument("-p", "--percent", type=str, required=False, help=SUPPRESS)
-        parser.add_argument("-s", "--seed", type=str, required=False, help=SUPPRESS)
-        parser.add_argument(
-            "-o", "--output_file", type=str, required=False, help=SUPPRESS
-        )
-        args = parser.parse_args(argv)
-        SubsetSEFastQReads(args).run()
 
-    @staticmethod
-    def trim_pe_adapters_fastq(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_TRIM_PE_ADAPTERS_FASTQ_DESC = f"""\
 
                 Trim adapters from paired-end FastQ data.
 
@@ -1301,25 +817,8 @@ class Biokit(object):
                 {adapters_available}
                 
                 """  # noqa
-            ),
-        )
-
-        parser.add_argument("fastq1", type=str, help=SUPPRESS)
-        parser.add_argument("fastq2", type=str, help=SUPPRESS)
-        parser.add_argument("-a", "--adapters", type=str, required=False, help=SUPPRESS)
-        parser.add_argument("-l", "--length", type=str, required=False, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        TrimPEAdaptersFastQ(args).run()
 
-    @staticmethod
-    def trim_pe_fastq(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_TRIM_PE_FASTQ_DESC = """\
 
                 Quality trim paired-end FastQ data.
 
@@ -1363,25 +862,8 @@ class Biokit(object):
                 -l/--length                 minimum length of read 
                                             to be kept. Default: 20
                 """  # noqa
-            ),
-        )
 
-        parser.add_argument("fastq1", type=str, help=SUPPRESS)
-        parser.add_argument("fastq2", type=str, help=SUPPRESS)
-        parser.add_argument("-m", "--minimum", type=str, required=False, help=SUPPRESS)
-        parser.add_argument("-l", "--length", type=str, required=False, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        TrimPEFastQ(args).run()
-
-    @staticmethod
-    def trim_se_adapters_fastq(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_TRIM_SE_ADAPTERS_FASTQ_DESC = f"""\
 
                 Trim adapters from single-end FastQ data.
 
@@ -1418,27 +900,8 @@ class Biokit(object):
                 {adapters_available}
                 
                 """  # noqa
-            ),
-        )
-
-        parser.add_argument("fastq", type=str, help=SUPPRESS)
-        parser.add_argument("-a", "--adapters", type=str, required=False, help=SUPPRESS)
-        parser.add_argument("-l", "--length", type=str, required=False, help=SUPPRESS)
-        parser.add_argument(
-            "-o", "--output_file", type=str, required=False, help=SUPPRESS
-        )
-        args = parser.parse_args(argv)
-        TrimSEAdaptersFastQ(args).run()
 
-    @staticmethod
-    def trim_se_fastq(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_TRIM_SE_FASTQ_DESC = """\
 
                 Quality trim single-end FastQ data.
 
@@ -1478,28 +941,8 @@ class Biokit(object):
 
                 -o/--output_file            output file name
                 """  # noqa
-            ),
-        )
-
-        parser.add_argument("fastq", type=str, help=SUPPRESS)
-        parser.add_argument("-m", "--minimum", type=str, required=False, help=SUPPRESS)
-        parser.add_argument("-l", "--length", type=str, required=False, help=SUPPRESS)
-        parser.add_argument(
-            "-o", "--output_file", type=str, required=False, help=SUPPRESS
-        )
-        args = parser.parse_args(argv)
-        TrimSEFastQ(args).run()
 
-    # genome functions
-    @staticmethod
-    def gc_content(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_GC_CONTENT_DESC = """\
                 
                 Calculate GC content of a fasta file.
 
@@ -1524,24 +967,8 @@ class Biokit(object):
                                             the GC content of each fasta
                                             entry
                 """  # noqa
-            ),
-        )
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        parser.add_argument(
-            "-v", "--verbose", action="store_true", required=False, help=SUPPRESS
-        )
-        args = parser.parse_args(argv)
-        GCContent(args).run()
 
-    @staticmethod
-    def genome_assembly_metrics(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_GENOME_ASSEMBLY_METRICS_DESC = """\
                 
                 Calculate L50, L90, N50, N90, GC content, assembly size,
                 number of scaffolds, number and sum length
@@ -1581,23 +1008,8 @@ class Biokit(object):
                                             value will be counted.
                                             Default: 500
                 """  # noqa
-            ),
-        )
-
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        parser.add_argument("-t", "--threshold", type=str, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        GenomeAssemblyMetrics(args).run()
 
-    @staticmethod
-    def l50(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_L50_DESC = """\
                 
                 Calculates L50 for a genome assembly.
 
@@ -1618,21 +1030,8 @@ class Biokit(object):
                                             function name should be
                                             a fasta file 
                 """  # noqa
-            ),
-        )
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        L50(args).run()
 
-    @staticmethod
-    def l90(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_L90_DESC = """\
                 
                 Calculates L90 for a genome assembly.
 
@@ -1653,21 +1052,8 @@ class Biokit(object):
                                             function name should be
                                             a fasta file 
                 """  # noqa
-            ),
-        )
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        L90(args).run()
 
-    @staticmethod
-    def longest_scaffold(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_LONGEST_SCAFFOLD_DESC = """\
 
                 Determine the length of the longest scaffold in a genome assembly.
                 
@@ -1685,22 +1071,8 @@ class Biokit(object):
                                             function name should be
                                             a fasta file 
                 """  # noqa
-            ),
-        )
 
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        LongestScaffold(args).run()
-
-    @staticmethod
-    def n50(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_N50_DESC = """\
                 
                 Calculates N50 for a genome assembly.
 
@@ -1720,21 +1092,8 @@ class Biokit(object):
                                             function name should be
                                             a fasta file 
                 """  # noqa
-            ),
-        )
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        N50(args).run()
 
-    @staticmethod
-    def n90(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_N90_DESC = """\
                 
                 Calculates N90 for a genome assembly.
 
@@ -1754,21 +1113,8 @@ class Biokit(object):
                                             function name should be
                                             a fasta file 
                 """  # noqa
-            ),
-        )
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        N90(args).run()
 
-    @staticmethod
-    def number_of_large_scaffolds(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_NUMBER_OF_LARGE_SCAFFOLDS_DESC = """\
 
                 Calculate number and total sequence length of
                 large scaffolds. Each value is represented as
@@ -1796,23 +1142,8 @@ class Biokit(object):
                                             value will be counted.
                                             Default: 500
                 """  # noqa
-            ),
-        )
-
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        parser.add_argument("-t", "--threshold", type=str, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        NumberOfLargeScaffolds(args).run()
 
-    @staticmethod
-    def number_of_scaffolds(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_NUMBER_OF_SCAFFOLDS_DESC = """\
 
                 Calculate the number of scaffolds or entries
                 in a FASTA file. In this way, a user can also 
@@ -1836,22 +1167,8 @@ class Biokit(object):
                                             function name should be
                                             a fasta file 
                 """  # noqa
-            ),
-        )
-
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        NumberOfScaffolds(args).run()
 
-    @staticmethod
-    def sum_of_scaffold_lengths(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_SUM_OF_SCAFFOLD_LENGTHS_DESC = """\
 
                 Determine the sum of scaffold lengths. 
                 
@@ -1874,23 +1191,8 @@ class Biokit(object):
                                             function name should be
                                             a fasta file
                 """  # noqa
-            ),
-        )
-
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        SumOfScaffoldLengths(args).run()
 
-    # text functions
-    @staticmethod
-    def character_frequency(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_CHARACTER_FREQUENCY_DESC = """\
 
                 Calculate the frequency of characters in a FASTA file.
                 
@@ -1908,22 +1210,8 @@ class Biokit(object):
                                             function name should be
                                             a fasta file
                 """  # noqa
-            ),
-        )
-
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        CharacterFrequency(args).run()
 
-    @staticmethod
-    def faidx(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_FAIDX_DESC = """\
 
                 Extracts sequence entry from fasta file.
 
@@ -1948,22 +1236,8 @@ class Biokit(object):
                 -e/--entry                  entry name to be extracted
                                             from the inputted fasta file
                 """  # noqa
-            ),
-        )
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        parser.add_argument("-e", "--entry", type=str, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        Faidx(args).run()
 
-    @staticmethod
-    def file_format_converter(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_FILE_FORMAT_CONVERTER_DESC = """\
 
                 Converts a multiple sequence file from one format to another.
 
@@ -2000,25 +1274,8 @@ class Biokit(object):
                 the following strings: fasta, clustal, maf, mauve, phylip,
                 phylip_sequential, phylip_relaxed, & stockholm.
                 """  # noqa
-            ),
-        )
-        parser.add_argument("-i", "--input_file", type=str, help=SUPPRESS)
-        parser.add_argument("-off", "--output_file_format", type=str, help=SUPPRESS)
-        parser.add_argument("-iff", "--input_file_format", type=str, help=SUPPRESS)
-        parser.add_argument("-o", "--output_file", type=str, help=SUPPRESS)
 
-        args = parser.parse_args(argv)
-        FileFormatConverter(args).run()
-
-    @staticmethod
-    def multiple_line_to_single_line_fasta(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_MULTIPLE_LINE_TO_SINGLE_LINE_FASTA_DESC = """\
                 Converts FASTA files with multiple lines
                 per sequence to a FASTA file with the sequence
                 represented on one line.
@@ -2041,21 +1298,8 @@ class Biokit(object):
                 -o/--output                 optional argument to name
                                             the output file
                 """  # noqa
-            ),
-        )
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        MultipleLineToSingleLineFasta(args).run()
 
-    @staticmethod
-    def remove_fasta_entry(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_REMOVE_FASTA_ENTRY_DESC = """\
                 Remove FASTA entry from multi-FASTA file.
 
                 Output will have the suffix "pruned.fa" unless
@@ -2086,23 +1330,8 @@ class Biokit(object):
                                             the suffix "pruned.fa" added
                                             to it.
                 """  # noqa
-            ),
-        )
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        parser.add_argument("-e", "--entry", type=str, help=SUPPRESS)
-        parser.add_argument("-o", "--output", type=str, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        RemoveFastaEntry(args).run()
 
-    @staticmethod
-    def remove_short_sequences(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_REMOVE_SHORT_SEQUENCES_DESC = """\
                 Remove short sequences from a multi-FASTA file.
 
                 Short sequences are defined as having a length
@@ -2139,23 +1368,8 @@ class Biokit(object):
                                             the suffix "long_seqs.fa" added
                                             to it.
                 """  # noqa
-            ),
-        )
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        parser.add_argument("-t", "--threshold", type=str, help=SUPPRESS)
-        parser.add_argument("-o", "--output", type=str, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        RemoveShortSequences(args).run()
 
-    @staticmethod
-    def rename_fasta_entries(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_RENAME_FASTA_ENTRIES_DESC = """\
                 Renames fasta entries.
 
                 Renaming fasta entries will follow the scheme of a tab-delimited
@@ -2189,23 +1403,8 @@ class Biokit(object):
                                             the suffix ".renamed.fa" added
                                             to it.
                 """  # noqa
-            ),
-        )
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        parser.add_argument("-i", "--idmap", type=str, help=SUPPRESS)
-        parser.add_argument("-o", "--output", type=str, required=False, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        RenameFastaEntries(args).run()
 
-    @staticmethod
-    def reorder_by_sequence_length(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_REORDER_BY_SEQUENCE_LENGTH_DESC = """\
                 Reorder FASTA file entries from the longest entry
                 to the shortest entry. 
 
@@ -2230,23 +1429,8 @@ class Biokit(object):
                                             the suffix ".reordered.fa" added
                                             to it.
                 """  # noqa
-            ),
-        )
 
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        parser.add_argument("-o", "--output", type=str, required=False, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        ReorderBySequenceLength(args).run()
-
-    @staticmethod
-    def sequence_complement(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_SEQUENCE_COMPLEMENT_DESC = """\
 
                 Generates the sequence complement for all entries
                 in a multi-FASTA file. To generate a reverse sequence
@@ -2269,25 +1453,8 @@ class Biokit(object):
                 -r/--reverse                if used, the reverse complement
                                             sequence will be generated
                 """  # noqa
-            ),
-        )
 
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        parser.add_argument(
-            "-r", "--reverse", action="store_true", required=False, help=SUPPRESS
-        )
-        args = parser.parse_args(argv)
-        SequenceComplement(args).run()
-
-    @staticmethod
-    def sequence_length(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_SEQUENCE_LENGTH_DESC = """\
 
                 Calculate sequence length of each FASTA entry.
                 
@@ -2305,22 +1472,8 @@ class Biokit(object):
                                             function name should be
                                             a fasta file 
                 """  # noqa
-            ),
-        )
-
-        parser.add_argument("fasta", type=str, help=SUPPRESS)
-        args = parser.parse_args(argv)
-        SequenceLength(args).run()
 
-    @staticmethod
-    def single_line_to_multiple_line_fasta(argv):
-        parser = ArgumentParser(
-            add_help=True,
-            usage=SUPPRESS,
-            formatter_class=RawDescriptionHelpFormatter,
-            description=textwrap.dedent(
-                f"""\
-                {help_header}
+_SINGLE_LINE_TO_MULTIPLE_LINE_FASTA_DESC = """\
                 Converts FASTA files with single lines per
                 sequence to a FASTA file with the sequence
                 on multiple lines. Each line with have 60 
@@ -2340,185 +1493,865 @@ class Biokit(object):
                                             function name should be
                                             a fasta file
                 """  # noqa
-            ),
+
+_DESCRIPTIONS = {
+    "biokit": _BIOKIT_DESC,
+    "alignment_length": _ALIGNMENT_LENGTH_DESC,
+    "alignment_recoding": _ALIGNMENT_RECODING_DESC,
+    "alignment_summary": _ALIGNMENT_SUMMARY_DESC,
+    "consensus_sequence": _CONSENSUS_SEQUENCE_DESC,
+    "constant_sites": _CONSTANT_SITES_DESC,
+    "parsimony_informative_sites": _PARSIMONY_INFORMATIVE_SITES_DESC,
+    "position_specific_score_matrix": _POSITION_SPECIFIC_SCORE_MATRIX_DESC,
+    "variable_sites": _VARIABLE_SITES_DESC,
+    "gc_content_first_position": _GC_CONTENT_FIRST_POSITION_DESC,
+    "gc_content_second_position": _GC_CONTENT_SECOND_POSITION_DESC,
+    "gc_content_third_position": _GC_CONTENT_THIRD_POSITION_DESC,
+    "gene_wise_relative_synonymous_codon_usage": _GENE_WISE_RELATIVE_SYNONYMOUS_CODON_USAGE_DESC,
+    "relative_synonymous_codon_usage": _RELATIVE_SYNONYMOUS_CODON_USAGE_DESC,
+    "translate_sequence": _TRANSLATE_SEQUENCE_DESC,
+    "fastq_read_lengths": _FASTQ_READ_LENGTHS_DESC,
+    "subset_pe_fastq_reads": _SUBSET_PE_FASTQ_READS_DESC,
+    "subset_se_fastq_reads": _SUBSET_SE_FASTQ_READS_DESC,
+    "trim_pe_adapters_fastq": _TRIM_PE_ADAPTERS_FASTQ_DESC,
+    "trim_pe_fastq": _TRIM_PE_FASTQ_DESC,
+    "trim_se_adapters_fastq": _TRIM_SE_ADAPTERS_FASTQ_DESC,
+    "trim_se_fastq": _TRIM_SE_FASTQ_DESC,
+    "gc_content": _GC_CONTENT_DESC,
+    "genome_assembly_metrics": _GENOME_ASSEMBLY_METRICS_DESC,
+    "l50": _L50_DESC,
+    "l90": _L90_DESC,
+    "longest_scaffold": _LONGEST_SCAFFOLD_DESC,
+    "n50": _N50_DESC,
+    "n90": _N90_DESC,
+    "number_of_large_scaffolds": _NUMBER_OF_LARGE_SCAFFOLDS_DESC,
+    "number_of_scaffolds": _NUMBER_OF_SCAFFOLDS_DESC,
+    "sum_of_scaffold_lengths": _SUM_OF_SCAFFOLD_LENGTHS_DESC,
+    "character_frequency": _CHARACTER_FREQUENCY_DESC,
+    "faidx": _FAIDX_DESC,
+    "file_format_converter": _FILE_FORMAT_CONVERTER_DESC,
+    "multiple_line_to_single_line_fasta": _MULTIPLE_LINE_TO_SINGLE_LINE_FASTA_DESC,
+    "remove_fasta_entry": _REMOVE_FASTA_ENTRY_DESC,
+    "remove_short_sequences": _REMOVE_SHORT_SEQUENCES_DESC,
+    "rename_fasta_entries": _RENAME_FASTA_ENTRIES_DESC,
+    "reorder_by_sequence_length": _REORDER_BY_SEQUENCE_LENGTH_DESC,
+    "sequence_complement": _SEQUENCE_COMPLEMENT_DESC,
+    "sequence_length": _SEQUENCE_LENGTH_DESC,
+    "single_line_to_multiple_line_fasta": _SINGLE_LINE_TO_MULTIPLE_LINE_FASTA_DESC,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _desc(command):
+    # collapse blank lines the same way argparse does when it prints
+    # help, so the text can also be written out directly
+    text = textwrap.dedent(help_header + _DESCRIPTIONS[command])
+    text = re.sub(r"\n\n\n+", "\n\n", text)
+    return text.strip("\n") + "\n"
+
+
+class _CommandParser(ArgumentParser):
+    """
+    argument parser that only renders a command's help text
+    when the help message is actually formatted
+    """
+
+    def __init__(self, command, **kwargs):
+        super().__init__(**kwargs)
+        self.command = command
+
+    def format_help(self):
+        if self.description is None:
+            self.description = _desc(self.command)
+        return super().format_help()
+
+
+def _make_parser(command):
+    return _CommandParser(
+        command,
+        add_help=True,
+        usage=SUPPRESS,
+        formatter_class=RawDescriptionHelpFormatter,
+    )
+
+
+def _is_help_option(arg):
+    # argparse also accepts unambiguous abbreviations such as --he
+    return arg == "-h" or (arg.startswith("--h") and "--help".startswith(arg))
+
+
+class Biokit(object):
+    # long form commands
+    _COMMANDS = frozenset(
+        [
+            "version",
+            # alignment functions
+            "alignment_length",
+            "alignment_recoding",
+            "alignment_summary",
+            "consensus_sequence",
+            "constant_sites",
+            "parsimony_informative_sites",
+            "position_specific_score_matrix",
+            "variable_sites",
+            # coding sequence functions
+            "gc_content_first_position",
+            "gc_content_second_position",
+            "gc_content_third_position",
+            "gene_wise_relative_synonymous_codon_usage",
+            "relative_synonymous_codon_usage",
+            "translate_sequence",
+            # fastq file functions
+            "fastq_read_lengths",
+            "subset_pe_fastq_reads",
+            "subset_se_fastq_reads",
+            "trim_pe_adapters_fastq",
+            "trim_pe_fastq",
+            "trim_se_adapters_fastq",
+            "trim_se_fastq",
+            # genome functions
+            "gc_content",
+            "genome_assembly_metrics",
+            "l50",
+            "l90",
+            "longest_scaffold",
+            "n50",
+            "n90",
+            "number_of_large_scaffolds",
+            "number_of_scaffolds",
+            "sum_of_scaffold_lengths",
+            # text functions
+            "character_frequency",
+            "faidx",
+            "file_format_converter",
+            "multiple_line_to_single_line_fasta",
+            "remove_fasta_entry",
+            "remove_short_sequences",
+            "rename_fasta_entries",
+            "reorder_by_sequence_length",
+            "sequence_complement",
+            "sequence_length",
+            "single_line_to_multiple_line_fasta",
+        ]
+    )
+
+    # aliases
+    _ALIASES = {
+        # version
+        "v": "version",
+        # aliases for alignments
+        "aln_len": "alignment_length",
+        "aln_recoding": "alignment_recoding",
+        "recode": "alignment_recoding",
+        "aln_summary": "alignment_summary",
+        "con_seq": "consensus_sequence",
+        "con_sites": "constant_sites",
+        "pi_sites": "parsimony_informative_sites",
+        "pis": "parsimony_informative_sites",
+        "pssm": "position_specific_score_matrix",
+        "var_sites": "variable_sites",
+        "vs": "variable_sites",
+        # aliases for coding sequences
+        "gc1": "gc_content_first_position",
+        "gc2": "gc_content_second_position",
+        "gc3": "gc_content_third_position",
+        "gene_wise_rscu": "gene_wise_relative_synonymous_codon_usage",
+        "gw_rscu": "gene_wise_relative_synonymous_codon_usage",
+        "grscu": "gene_wise_relative_synonymous_codon_usage",
+        "rscu": "relative_synonymous_codon_usage",
+        "translate_seq": "translate_sequence",
+        "trans_seq": "translate_sequence",
+        # aliases for fastq files
+        "fastq_read_lens": "fastq_read_lengths",
+        "subset_pe_fastq": "subset_pe_fastq_reads",
+        "subset_se_fastq": "subset_se_fastq_reads",
+        "trim_pe_adapters_fastq_reads": "trim_pe_adapters_fastq",
+        "trim_pe_fastq_reads": "trim_pe_fastq",
+        "trim_se_adapters_fastq_reads": "trim_se_adapters_fastq",
+        "trim_se_fastq_reads": "trim_se_fastq",
+        # aliases for genomes
+        "gc": "gc_content",
+        "assembly_metrics": "genome_assembly_metrics",
+        "longest_scaff": "longest_scaffold",
+        "longest_contig": "longest_scaffold",
+        "longest_cont": "longest_scaffold",
+        "num_of_lrg_scaffolds": "number_of_large_scaffolds",
+        "number_of_large_contigs": "number_of_large_scaffolds",
+        "num_of_lrg_cont": "number_of_large_scaffolds",
+        "num_of_scaffolds": "number_of_scaffolds",
+        "number_of_contigs": "number_of_scaffolds",
+        "num_of_cont": "number_of_scaffolds",
+        "sum_of_contig_lengths": "sum_of_scaffold_lengths",
+        # alias for sequence files
+        "char_freq": "character_frequency",
+        "get_entry": "faidx",
+        "ge": "faidx",
+        "format_converter": "file_format_converter",
+        "ffc": "file_format_converter",
+        "ml2sl": "multiple_line_to_single_line_fasta",
+        "remove_short_seqs": "remove_short_sequences",
+        "rename_fasta": "rename_fasta_entries",
+        "reorder_by_seq_len": "reorder_by_sequence_length",
+        "seq_comp": "sequence_complement",
+        "seq_len": "sequence_length",
+        "sl2ml": "single_line_to_multiple_line_fasta",
+    }
+
+    def __init__(self, argv=None):
+        if argv is None:
+            argv = sys.argv[1:]
+
+        # only the command name is needed here, so the top-level
+        # arguments are handled without building an ArgumentParser
+        if not argv or argv[0].startswith("-"):
+            if argv and _is_help_option(argv[0]):
+                sys.stdout.write(_desc("biokit"))
+                sys.exit(0)
+            sys.stderr.write(
+                "biokit: error: the following arguments are required: command\n"
+            )
+            sys.exit(2)
+        command = argv[0]
+
+        # if command is part of the possible commands (i.e., the long form
+        # commands, run). Otherwise, assume it is an alias and look to the
+        # run_alias function
+        try:
+            if command in self._COMMANDS:
+                getattr(type(self), command)(argv[1:])
+            else:
+                self.run_alias(command, argv[1:])
+        except NameError as e:
+            print(e)
+            sys.exit()
+
+    def run_alias(self, command, argv):
+        target = self._ALIASES.get(command)
+        if target is None:
+            print(
+                "Invalid command option. See help for a complete list of commands and aliases."
+            )
+            sys.stdout.write(_desc("biokit"))
+            sys.exit(1)
+        return getattr(type(self), target)(argv)
+
+    # print version
+    @staticmethod
+    def version(argv=None):
+        print(textwrap.dedent(help_header + "\n"))
+
+    # alignment functions
+    @staticmethod
+    def alignment_length(argv):
+        parser = _make_parser("alignment_length")
+
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.alignment import AlignmentLength
+        AlignmentLength(args).run()
+
+    @staticmethod
+    def alignment_recoding(argv):
+        parser = _make_parser("alignment_recoding")
+
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        parser.add_argument("-c", "--code", type=str, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.alignment import AlignmentRecoding
+        AlignmentRecoding(args).run()
+
+    @staticmethod
+    def alignment_summary(argv):
+        parser = _make_parser("alignment_summary")
+
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.alignment import AlignmentSummary
+        AlignmentSummary(args).run()
+
+    @staticmethod
+    def consensus_sequence(argv):
+        parser = _make_parser("consensus_sequence")
+
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        parser.add_argument("-t", "--threshold", type=str, help=SUPPRESS)
+        parser.add_argument("-ac", "--ambiguous_character", type=str, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.alignment import ConsensusSequence
+        ConsensusSequence(args).run()
+
+    @staticmethod
+    def constant_sites(argv):
+        parser = _make_parser("constant_sites")
+
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        parser.add_argument("-v", "--verbose", action="store_true", required=False, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.alignment import ConstantSites
+        ConstantSites(args).run()
+
+    @staticmethod
+    def parsimony_informative_sites(argv):
+        parser = _make_parser("parsimony_informative_sites")
+
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        parser.add_argument("-v", "--verbose", action="store_true", required=False, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.alignment import ParsimonyInformativeSites
+        ParsimonyInformativeSites(args).run()
+
+    @staticmethod
+    def position_specific_score_matrix(argv):
+        parser = _make_parser("position_specific_score_matrix")
+
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        parser.add_argument("-ac", "--ambiguous_character", type=str, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.alignment import PositionSpecificScoreMatrix
+        PositionSpecificScoreMatrix(args).run()
+
+    @staticmethod
+    def variable_sites(argv):
+        parser = _make_parser("variable_sites")
+
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        parser.add_argument("-v", "--verbose", action="store_true", required=False, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.alignment import VariableSites
+        VariableSites(args).run()
+
+    # coding sequence functions
+    @staticmethod
+    def gc_content_first_position(argv):
+        parser = _make_parser("gc_content_first_position")
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        parser.add_argument(
+            "-v", "--verbose", action="store_true", required=False, help=SUPPRESS
+        )
+        args = parser.parse_args(argv)
+        from .services.coding_sequences import GCContentFirstPosition
+        GCContentFirstPosition(args).run()
+
+    @staticmethod
+    def gc_content_second_position(argv):
+        parser = _make_parser("gc_content_second_position")
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        parser.add_argument(
+            "-v", "--verbose", action="store_true", required=False, help=SUPPRESS
         )
+        args = parser.parse_args(argv)
+        from .services.coding_sequences import GCContentSecondPosition
+        GCContentSecondPosition(args).run()
+
+    @staticmethod
+    def gc_content_third_position(argv):
+        parser = _make_parser("gc_content_third_position")
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        parser.add_argument(
+            "-v", "--verbose", action="store_true", required=False, help=SUPPRESS
+        )
+        args = parser.parse_args(argv)
+        from .services.coding_sequences import GCContentThirdPosition
+        GCContentThirdPosition(args).run()
+
+    @staticmethod
+    def gene_wise_relative_synonymous_codon_usage(argv):
+        parser = _make_parser("gene_wise_relative_synonymous_codon_usage")
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        parser.add_argument(
+            "-tt", "--translation_table", type=str, required=False, help=SUPPRESS
+        )
+        args = parser.parse_args(argv)
+        from .services.coding_sequences import GeneWiseRelativeSynonymousCodonUsage
+        GeneWiseRelativeSynonymousCodonUsage(args).run()
+
+    @staticmethod
+    def relative_synonymous_codon_usage(argv):
+        parser = _make_parser("relative_synonymous_codon_usage")
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        parser.add_argument(
+            "-tt", "--translation_table", type=str, required=False, help=SUPPRESS
+        )
+        args = parser.parse_args(argv)
+        from .services.coding_sequences import RelativeSynonymousCodonUsage
+        RelativeSynonymousCodonUsage(args).run()
+
+    @staticmethod
+    def translate_sequence(argv):
+        parser = _make_parser("translate_sequence")
+
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        parser.add_argument(
+            "-tt", "--translation_table", type=str, required=False, help=SUPPRESS
+        )
+        parser.add_argument("-o", "--output", type=str, required=False, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.coding_sequences import TranslateSequence
+        TranslateSequence(args).run()
+
+    # fastq file functions
+    @staticmethod
+    def fastq_read_lengths(argv):
+        parser = _make_parser("fastq_read_lengths")
+
+        parser.add_argument("fastq", type=str, help=SUPPRESS)
+        parser.add_argument(
+            "-v", "--verbose", action="store_true", required=False, help=SUPPRESS
+        )
+        args = parser.parse_args(argv)
+        from .services.fastq import FastQReadLengths
+        FastQReadLengths(args).run()
+
+    @staticmethod
+    def subset_pe_fastq_reads(argv):
+        parser = _make_parser("subset_pe_fastq_reads")
+
+        parser.add_argument("fastq1", type=str, help=SUPPRESS)
+        parser.add_argument("fastq2", type=str, help=SUPPRESS)
+        parser.add_argument("-p", "--percent", type=str, required=False, help=SUPPRESS)
+        parser.add_argument("-s", "--seed", type=str, required=False, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.fastq import SubsetPEFastQReads
+        SubsetPEFastQReads(args).run()
+
+    @staticmethod
+    def subset_se_fastq_reads(argv):
+        parser = _make_parser("subset_se_fastq_reads")
+
+        parser.add_argument("fastq", type=str, help=SUPPRESS)
+        parser.add_argument("-p", "--percent", type=str, required=False, help=SUPPRESS)
+        parser.add_argument("-s", "--seed", type=str, required=False, help=SUPPRESS)
+        parser.add_argument(
+            "-o", "--output_file", type=str, required=False, help=SUPPRESS
+        )
+        args = parser.parse_args(argv)
+        from .services.fastq import SubsetSEFastQReads
+        SubsetSEFastQReads(args).run()
+
+    @staticmethod
+    def trim_pe_adapters_fastq(argv):
+        parser = _make_parser("trim_pe_adapters_fastq")
+
+        parser.add_argument("fastq1", type=str, help=SUPPRESS)
+        parser.add_argument("fastq2", type=str, help=SUPPRESS)
+        parser.add_argument("-a", "--adapters", type=str, required=False, help=SUPPRESS)
+        parser.add_argument("-l", "--length", type=str, required=False, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.fastq import TrimPEAdaptersFastQ
+        TrimPEAdaptersFastQ(args).run()
+
+    @staticmethod
+    def trim_pe_fastq(argv):
+        parser = _make_parser("trim_pe_fastq")
+
+        parser.add_argument("fastq1", type=str, help=SUPPRESS)
+        parser.add_argument("fastq2", type=str, help=SUPPRESS)
+        parser.add_argument("-m", "--minimum", type=str, required=False, help=SUPPRESS)
+        parser.add_argument("-l", "--length", type=str, required=False, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.fastq import TrimPEFastQ
+        TrimPEFastQ(args).run()
+
+    @staticmethod
+    def trim_se_adapters_fastq(argv):
+        parser = _make_parser("trim_se_adapters_fastq")
+
+        parser.add_argument("fastq", type=str, help=SUPPRESS)
+        parser.add_argument("-a", "--adapters", type=str, required=False, help=SUPPRESS)
+        parser.add_argument("-l", "--length", type=str, required=False, help=SUPPRESS)
+        parser.add_argument(
+            "-o", "--output_file", type=str, required=False, help=SUPPRESS
+        )
+        args = parser.parse_args(argv)
+        from .services.fastq import TrimSEAdaptersFastQ
+        TrimSEAdaptersFastQ(args).run()
+
+    @staticmethod
+    def trim_se_fastq(argv):
+        parser = _make_parser("trim_se_fastq")
+
+        parser.add_argument("fastq", type=str, help=SUPPRESS)
+        parser.add_argument("-m", "--minimum", type=str, required=False, help=SUPPRESS)
+        parser.add_argument("-l", "--length", type=str, required=False, help=SUPPRESS)
+        parser.add_argument(
+            "-o", "--output_file", type=str, required=False, help=SUPPRESS
+        )
+        args = parser.parse_args(argv)
+        from .services.fastq import TrimSEFastQ
+        TrimSEFastQ(args).run()
+
+    # genome functions
+    @staticmethod
+    def gc_content(argv):
+        parser = _make_parser("gc_content")
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        parser.add_argument(
+            "-v", "--verbose", action="store_true", required=False, help=SUPPRESS
+        )
+        args = parser.parse_args(argv)
+        from .services.genome import GCContent
+        GCContent(args).run()
+
+    @staticmethod
+    def genome_assembly_metrics(argv):
+        parser = _make_parser("genome_assembly_metrics")
+
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        parser.add_argument("-t", "--threshold", type=str, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.genome import GenomeAssemblyMetrics
+        GenomeAssemblyMetrics(args).run()
+
+    @staticmethod
+    def l50(argv):
+        parser = _make_parser("l50")
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.genome import L50
+        L50(args).run()
+
+    @staticmethod
+    def l90(argv):
+        parser = _make_parser("l90")
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.genome import L90
+        L90(args).run()
+
+    @staticmethod
+    def longest_scaffold(argv):
+        parser = _make_parser("longest_scaffold")
+
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.genome import LongestScaffold
+        LongestScaffold(args).run()
+
+    @staticmethod
+    def n50(argv):
+        parser = _make_parser("n50")
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.genome import N50
+        N50(args).run()
+
+    @staticmethod
+    def n90(argv):
+        parser = _make_parser("n90")
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.genome import N90
+        N90(args).run()
+
+    @staticmethod
+    def number_of_large_scaffolds(argv):
+        parser = _make_parser("number_of_large_scaffolds")
+
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        parser.add_argument("-t", "--threshold", type=str, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.genome import NumberOfLargeScaffolds
+        NumberOfLargeScaffolds(args).run()
+
+    @staticmethod
+    def number_of_scaffolds(argv):
+        parser = _make_parser("number_of_scaffolds")
+
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.genome import NumberOfScaffolds
+        NumberOfScaffolds(args).run()
+
+    @staticmethod
+    def sum_of_scaffold_lengths(argv):
+        parser = _make_parser("sum_of_scaffold_lengths")
+
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.genome import SumOfScaffoldLengths
+        SumOfScaffoldLengths(args).run()
+
+    # text functions
+    @staticmethod
+    def character_frequency(argv):
+        parser = _make_parser("character_frequency")
+
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.text import CharacterFrequency
+        CharacterFrequency(args).run()
+
+    @staticmethod
+    def faidx(argv):
+        parser = _make_parser("faidx")
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        parser.add_argument("-e", "--entry", type=str, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.text import Faidx
+        Faidx(args).run()
+
+    @staticmethod
+    def file_format_converter(argv):
+        parser = _make_parser("file_format_converter")
+        parser.add_argument("-i", "--input_file", type=str, help=SUPPRESS)
+        parser.add_argument("-off", "--output_file_format", type=str, help=SUPPRESS)
+        parser.add_argument("-iff", "--input_file_format", type=str, help=SUPPRESS)
+        parser.add_argument("-o", "--output_file", type=str, help=SUPPRESS)
+
+        args = parser.parse_args(argv)
+        from .services.text import FileFormatConverter
+        FileFormatConverter(args).run()
+
+    @staticmethod
+    def multiple_line_to_single_line_fasta(argv):
+        parser = _make_parser("multiple_line_to_single_line_fasta")
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.text import MultipleLineToSingleLineFasta
+        MultipleLineToSingleLineFasta(args).run()
+
+    @staticmethod
+    def remove_fasta_entry(argv):
+        parser = _make_parser("remove_fasta_entry")
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        parser.add_argument("-e", "--entry", type=str, help=SUPPRESS)
+        parser.add_argument("-o", "--output", type=str, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.text import RemoveFastaEntry
+        RemoveFastaEntry(args).run()
+
+    @staticmethod
+    def remove_short_sequences(argv):
+        parser = _make_parser("remove_short_sequences")
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        parser.add_argument("-t", "--threshold", type=str, help=SUPPRESS)
+        parser.add_argument("-o", "--output", type=str, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.text import RemoveShortSequences
+        RemoveShortSequences(args).run()
+
+    @staticmethod
+    def rename_fasta_entries(argv):
+        parser = _make_parser("rename_fasta_entries")
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        parser.add_argument("-i", "--idmap", type=str, help=SUPPRESS)
+        parser.add_argument("-o", "--output", type=str, required=False, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.text import RenameFastaEntries
+        RenameFastaEntries(args).run()
+
+    @staticmethod
+    def reorder_by_sequence_length(argv):
+        parser = _make_parser("reorder_by_sequence_length")
+
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        parser.add_argument("-o", "--output", type=str, required=False, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.text import ReorderBySequenceLength
+        ReorderBySequenceLength(args).run()
+
+    @staticmethod
+    def sequence_complement(argv):
+        parser = _make_parser("sequence_complement")
+
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        parser.add_argument(
+            "-r", "--reverse", action="store_true", required=False, help=SUPPRESS
+        )
+        args = parser.parse_args(argv)
+        from .services.text import SequenceComplement
+        SequenceComplement(args).run()
+
+    @staticmethod
+    def sequence_length(argv):
+        parser = _make_parser("sequence_length")
+
+        parser.add_argument("fasta", type=str, help=SUPPRESS)
+        args = parser.parse_args(argv)
+        from .services.text import SequenceLength
+        SequenceLength(args).run()
+
+    @staticmethod
+    def single_line_to_multiple_line_fasta(argv):
+        parser = _make_parser("single_line_to_multiple_line_fasta")
         parser.add_argument("fasta", type=str, help=SUPPRESS)
         args = parser.parse_args(argv)
+        from .services.text import SingleLineToMultipleLineFasta
         SingleLineToMultipleLineFasta(args).run()
 
 
 def main(argv=None):
-    Biokit()
+    Biokit(argv)
 
 
 # Alignment-based functions
 def alignment_length(argv=None):
-    Biokit.alignment_length(sys.argv[1:])
+    Biokit.alignment_length(sys.argv[1:] if argv is None else argv)
 
 
 def alignment_recoding(argv=None):
-    Biokit.alignment_recoding(sys.argv[1:])
+    Biokit.alignment_recoding(sys.argv[1:] if argv is None else argv)
 
 
 def alignment_summary(argv=None):
-    Biokit.alignment_summary(sys.argv[1:])
+    Biokit.alignment_summary(sys.argv[1:] if argv is None else argv)
 
 
 def consensus_sequence(argv=None):
-    Biokit.consensus_sequence(sys.argv[1:])
+    Biokit.consensus_sequence(sys.argv[1:] if argv is None else argv)
 
 
 def constant_sites(argv=None):
-    Biokit.constant_sites(sys.argv[1:])
+    Biokit.constant_sites(sys.argv[1:] if argv is None else argv)
 
 
 def parsimony_informative_sites(argv=None):
-    Biokit.parsimony_informative_sites(sys.argv[1:])
+    Biokit.parsimony_informative_sites(sys.argv[1:] if argv is None else argv)
 
 
 def position_specific_score_matrix(argv=None):
-    Biokit.position_specific_score_matrix(sys.argv[1:])
+    Biokit.position_specific_score_matrix(sys.argv[1:] if argv is None else argv)
 
 
 def variable_sites(argv=None):
-    Biokit.variable_sites(sys.argv[1:])
+    Biokit.variable_sites(sys.argv[1:] if argv is None else argv)
 
 
 # Coding sequences-based functions
 def gc_content_first_position(argv=None):
-    Biokit.gc_content_first_position(sys.argv[1:])
+    Biokit.gc_content_first_position(sys.argv[1:] if argv is None else argv)
 
 
 def gc_content_second_position(argv=None):
-    Biokit.gc_content_second_position(sys.argv[1:])
+    Biokit.gc_content_second_position(sys.argv[1:] if argv is None else argv)
 
 
 def gc_content_third_position(argv=None):
-    Biokit.gc_content_third_position(sys.argv[1:])
+    Biokit.gc_content_third_position(sys.argv[1:] if argv is None else argv)
 
 
 def gene_wise_relative_synonymous_codon_usage(argv=None):
-    Biokit.gene_wise_relative_synonymous_codon_usage(sys.argv[1:])
+    Biokit.gene_wise_relative_synonymous_codon_usage(sys.argv[1:] if argv is None else argv)
 
 
 def relative_synonymous_codon_usage(argv=None):
-    Biokit.relative_synonymous_codon_usage(sys.argv[1:])
+    Biokit.relative_synonymous_codon_usage(sys.argv[1:] if argv is None else argv)
 
 
 def translate_sequence(argv=None):
-    Biokit.translate_sequence(sys.argv[1:])
+    Biokit.translate_sequence(sys.argv[1:] if argv is None else argv)
 
 
 # FASTQ-based functions
 def fastq_read_lengths(argv=None):
-    Biokit.fastq_read_lengths(sys.argv[1:])
+    Biokit.fastq_read_lengths(sys.argv[1:] if argv is None else argv)
 
 
 def subset_pe_fastq_reads(argv=None):
-    Biokit.subset_pe_fastq_reads(sys.argv[1:])
+    Biokit.subset_pe_fastq_reads(sys.argv[1:] if argv is None else argv)
 
 
 def subset_se_fastq_reads(argv=None):
-    Biokit.subset_se_fastq_reads(sys.argv[1:])
+    Biokit.subset_se_fastq_reads(sys.argv[1:] if argv is None else argv)
 
 
 def trim_pe_adapters_fastq(argv=None):
-    Biokit.trim_pe_adapters_fastq(sys.argv[1:])
+    Biokit.trim_pe_adapters_fastq(sys.argv[1:] if argv is None else argv)
 
 
 def trim_pe_fastq(argv=None):
-    Biokit.trim_pe_fastq(sys.argv[1:])
+    Biokit.trim_pe_fastq(sys.argv[1:] if argv is None else argv)
 
 
 def trim_se_adapters_fastq(argv=None):
-    Biokit.trim_se_adapters_fastq(sys.argv[1:])
+    Biokit.trim_se_adapters_fastq(sys.argv[1:] if argv is None else argv)
 
 
 def trim_se_fastq(argv=None):
-    Biokit.trim_se_fastq(sys.argv[1:])
+    Biokit.trim_se_fastq(sys.argv[1:] if argv is None else argv)
 
 
 # genome-based functions
 def gc_content(argv=None):
-    Biokit.gc_content(sys.argv[1:])
+    Biokit.gc_content(sys.argv[1:] if argv is None else argv)
 
 
 def genome_assembly_metrics(argv=None):
-    Biokit.genome_assembly_metrics(sys.argv[1:])
+    Biokit.genome_assembly_metrics(sys.argv[1:] if argv is None else argv)
 
 
 def l50(argv=None):
-    Biokit.l50(sys.argv[1:])
+    Biokit.l50(sys.argv[1:] if argv is None else argv)
 
 
 def l90(argv=None):
-    Biokit.l90(sys.argv[1:])
+    Biokit.l90(sys.argv[1:] if argv is None else argv)
 
 
 def longest_scaffold(argv=None):
-    Biokit.longest_scaffold(sys.argv[1:])
+    Biokit.longest_scaffold(sys.argv[1:] if argv is None else argv)
 
 
 def n50(argv=None):
-    Biokit.n50(sys.argv[1:])
+    Biokit.n50(sys.argv[1:] if argv is None else argv)
 
 
 def n90(argv=None):
-    Biokit.n90(sys.argv[1:])
+    Biokit.n90(sys.argv[1:] if argv is None else argv)
 
 
 def number_of_large_scaffolds(argv=None):
-    Biokit.number_of_large_scaffolds(sys.argv[1:])
+    Biokit.number_of_large_scaffolds(sys.argv[1:] if argv is None else argv)
 
 
 def number_of_scaffolds(argv=None):
-    Biokit.number_of_scaffolds(sys.argv[1:])
+    Biokit.number_of_scaffolds(sys.argv[1:] if argv is None else argv)
 
 
 def sum_of_scaffold_lengths(argv=None):
-    Biokit.sum_of_scaffold_lengths(sys.argv[1:])
+    Biokit.sum_of_scaffold_lengths(sys.argv[1:] if argv is None else argv)
 
 
 # sequence-based functions
 def character_frequency(argv=None):
-    Biokit.character_frequency(sys.argv[1:])
+    Biokit.character_frequency(sys.argv[1:] if argv is None else argv)
 
 
 def faidx(argv=None):
-    Biokit.faidx(sys.argv[1:])
+    Biokit.faidx(sys.argv[1:] if argv is None else argv)
 
 
 def file_format_converter(argv=None):
-    Biokit.file_format_converter(sys.argv[1:])
+    Biokit.file_format_converter(sys.argv[1:] if argv is None else argv)
 
 
 def multiple_line_to_single_line_fasta(argv=None):
-    Biokit.multiple_line_to_single_line_fasta(sys.argv[1:])
+    Biokit.multiple_line_to_single_line_fasta(sys.argv[1:] if argv is None else argv)
 
 
 def remove_fasta_entry(argv=None):
-    Biokit.remove_fasta_entry(sys.argv[1:])
+    Biokit.remove_fasta_entry(sys.argv[1:] if argv is None else argv)
 
 
 def remove_short_sequences(argv=None):
-    Biokit.remove_short_sequences(sys.argv[1:])
+    Biokit.remove_short_sequences(sys.argv[1:] if argv is None else argv)
 
 
 def rename_fasta_entries(argv=None):
-    Biokit.rename_fasta_entries(sys.argv[1:])
+    Biokit.rename_fasta_entries(sys.argv[1:] if argv is None else argv)
 
 
 def reorder_by_sequence_length(argv=None):
-    Biokit.reorder_by_sequence_length(sys.argv[1:])
+    Biokit.reorder_by_sequence_length(sys.argv[1:] if argv is None else argv)
 
 
 def sequence_complement(argv=None):
-    Biokit.sequence_complement(sys.argv[1:])
+    Biokit.sequence_complement(sys.argv[1:] if argv is None else argv)
 
 
 def sequence_length(argv=None):
-    Biokit.sequence_length(sys.argv[1:])
+    Biokit.sequence_length(sys.argv[1:] if argv is None else argv)
 
 
 def single_line_to_multiple_line_fasta(argv=None):
-    Biokit.single_line_to_multiple_line_fasta(sys.argv[1:])
+    Biokit.single_line_to_multiple_line_fasta(sys.argv[1:] if argv is None else argv)
@@ -3,10 +3,7 @@ from .base import Genome
 
 class L90(Genome):
     def __init__(self, args) -> None:
-        super().__init__(**self.process_args(args))
+        super().__init__(fasta=args.fasta)
 
     def run(self):
         print(self.calc_l90())
-
-    def process_args(self, args):
-        return dict(fasta=args.fasta)
@@ -11,6 +11,16 @@ here = Path(__file__)
 @pytest.mark.slow
 @pytest.mark.integration
 class TestCLIRunners(object):
+    def test_biokit_version(self):
+        cmd = "biokit version"
+        exit_status = os.system(cmd)
+        assert exit_status == 0
+
+    def test_biokit_v(self):
+        cmd = "biokit v"
+        exit_status = os.system(cmd)
+        assert exit_status == 0
+
     def test_bk_alignment_length(self):
         cmd = "bk_alignment_length -h"
         exit_status = os.system(cmd)
@@ -0,0 +1,131 @@
+import pytest
+import subprocess
+import sys
+from mock import patch
+
+from biokit.biokit import Biokit, _CommandParser
+from biokit.version import __version__
+
+
+class TestBiokit(object):
+    def test_import_does_not_load_services(self):
+        code = (
+            "import sys\n"
+            "import biokit.biokit\n"
+            "loaded = [m for m in sys.modules if m.startswith('biokit.services')]\n"
+            "assert not loaded, loaded\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+        )
+        assert result.returncode == 0, result.stderr
+
+    @pytest.mark.parametrize("argv", [["-h"], ["--help"], ["--he"]])
+    def test_help_includes_description(self, argv, capsys):
+        with pytest.raises(SystemExit) as pytest_wrapped_e:
+            Biokit.l90(argv)
+
+        assert pytest_wrapped_e.value.code == 0
+        assert "Calculates L90 for a genome assembly." in capsys.readouterr().out
+
+    @pytest.mark.parametrize("argv", [["-vh"], ["-hv"], ["some.fa", "-vh"]])
+    def test_help_in_short_flag_bundle_includes_description(self, argv, capsys):
+        with pytest.raises(SystemExit) as pytest_wrapped_e:
+            Biokit.constant_sites(argv)
+
+        assert pytest_wrapped_e.value.code == 0
+        assert "Calculate the number of constant sites" in capsys.readouterr().out
+
+    def test_description_not_rendered_without_help(self):
+        parser = _CommandParser("l90")
+        parser.add_argument("fasta")
+        parser.parse_args(["some.fa"])
+
+        assert parser.description is None
+
+    def test_aliases_resolve_to_commands(self):
+        for alias, command in Biokit._ALIASES.items():
+            assert alias not in Biokit._COMMANDS
+            assert command in Biokit._COMMANDS
+
+    def test_commands_are_callable(self):
+        for command in Biokit._COMMANDS:
+            assert callable(getattr(Biokit, command))
+
+    @pytest.mark.parametrize("command", ["version", "v"])
+    def test_version(self, command, capsys):
+        with patch.object(sys, "argv", ["biokit", command]):
+            Biokit()
+
+        assert f"Version: {__version__}" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("command", ["run_alias", "not_a_command"])
+    def test_invalid_command(self, command):
+        with patch.object(sys, "argv", ["biokit", command]):
+            with pytest.raises(SystemExit) as pytest_wrapped_e:
+                Biokit()
+
+        assert pytest_wrapped_e.value.code == 1
+
+    def test_top_level_help_includes_description(self, capsys):
+        with patch.object(sys, "argv", ["biokit", "-h"]):
+            with pytest.raises(SystemExit) as pytest_wrapped_e:
+                Biokit()
+
+        assert pytest_wrapped_e.value.code == 0
+        assert "BioKIT is a broadly applicable" in capsys.readouterr().out
+
+    def test_argv_is_passed_through(self, capsys):
+        with patch.object(sys, "argv", ["biokit", "not_a_command"]):
+            Biokit(["version"])
+
+        assert f"Version: {__version__}" in capsys.readouterr().out
+
+    @patch("biokit.biokit.ArgumentParser.__init__")
+    def test_top_level_does_not_build_a_parser(self, mocked_init, capsys):
+        Biokit(["version"])
+
+        mocked_init.assert_not_called()
+
+    @pytest.mark.parametrize("argv", [["-h"], ["--help"], ["--he"]])
+    def test_top_level_help(self, argv, capsys):
+        with pytest.raises(SystemExit) as pytest_wrapped_e:
+            Biokit(argv)
+
+        assert pytest_wrapped_e.value.code == 0
+        assert "Usage: biokit <command>" in capsys.readouterr().out
+
+    def test_top_level_unknown_option(self, capsys):
+        with pytest.raises(SystemExit) as pytest_wrapped_e:
+            Biokit(["-x"])
+
+        assert pytest_wrapped_e.value.code == 2
+        assert "required: command" in capsys.readouterr().err
+
+    def test_missing_command(self):
+        with pytest.raises(SystemExit) as pytest_wrapped_e:
+            Biokit([])
+
+        assert pytest_wrapped_e.value.code == 2
+
+    def test_command_help_does_not_load_services(self):
+        code = (
+            "import sys\n"
+            "from biokit.biokit import Biokit\n"
+            "try:\n"
+            "    Biokit(['l90', '-h'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "loaded = [m for m in sys.modules if m.startswith('biokit.services')]\n"
+            "assert not loaded, loaded\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+        )
+        assert result.returncode == 0, result.stderr